@@ -1,3 +1,7 @@
+import collections
+from operator import attrgetter
+
+
 def best(habit_list):
     """
     Takes in a list of habits and sorts them descending based on habit streak.
@@ -8,7 +12,7 @@ def best(habit_list):
         sorted list of habits
     """
 
-    return sorted(habit_list, key=lambda x: x.streak, reverse=True)
+    return sorted(habit_list, key=attrgetter('streak'), reverse=True)
 
 
 def worst(habit_list):
@@ -20,7 +24,7 @@ def worst(habit_list):
     Returns:
         sorted list of habits
     """
-    return sorted(habit_list, key=lambda x: x.fail_count, reverse=True)
+    return sorted(habit_list, key=attrgetter('fail_count'), reverse=True)
 
 
 def group_by_periodicity(habit_list):
@@ -35,22 +39,67 @@ def group_by_periodicity(habit_list):
             values: sorted lists of habits with that periodicity
     """
 
-    daily_habits = []
-    weekly_habits = []
-    monthly_habits = []
-
+    # one pass to bucket the habits by their period attribute, then one sort per bucket
+    buckets = collections.defaultdict(list)
     for habit in habit_list:
-        match habit.period:
-            case 'Daily':
-                daily_habits.append(habit)
-            case 'Weekly':
-                weekly_habits.append(habit)
-            case 'Monthly':
-                monthly_habits.append(habit)
+        buckets[habit.period].append(habit)
+
+    return {period: sorted(buckets[period], key=attrgetter('streak'), reverse=True)
+            for period in ('Daily', 'Weekly', 'Monthly')}
+
+
+class HabitCollection:
+    """
+    A light wrapper around the list of habits that caches the analytics results.
+
+    The UI re-requests best/worst/period groupings on every refresh, but the underlying habits only
+    change on a check-off, restart, addition or deletion. The collection keeps the last computed
+    result of each function and hands it back until invalidate() is called, so an unchanged refresh
+    costs a cache lookup instead of a full sort.
+
+    The module-level best/worst/group_by_periodicity functions stay as the plain, uncached API.
+
+    Attributes:
+        habits (list): the wrapped list of habits; mutate it (and call invalidate()) as needed.
+    """
+
+    def __init__(self, habits=None):
+        self.habits = list(habits) if habits is not None else []
 
-    return {'Daily': best(daily_habits),
-            'Weekly': best(weekly_habits),
-            'Monthly': best(monthly_habits)}
+        self._best_cache = None
+        self._worst_cache = None
+        self._period_cache = None
+
+    def invalidate(self):
+        """
+        Drops the cached results. Call after any change to the habits (check-off, restart,
+        addition, deletion) so the next analytics request recomputes.
+        """
+
+        self._best_cache = None
+        self._worst_cache = None
+        self._period_cache = None
+
+    def best(self):
+        """Cached equivalent of best(self.habits)."""
+
+        if self._best_cache is None:
+            self._best_cache = best(self.habits)
+        return self._best_cache
+
+    def worst(self):
+        """Cached equivalent of worst(self.habits)."""
+
+        if self._worst_cache is None:
+            self._worst_cache = worst(self.habits)
+        return self._worst_cache
+
+    def group_by_periodicity(self):
+        """Cached equivalent of group_by_periodicity(self.habits)."""
+
+        if self._period_cache is None:
+            self._period_cache = group_by_periodicity(self.habits)
+        return self._period_cache
 
 
 def ui_parse(raw_list, mode):
@@ -65,33 +114,18 @@ def ui_parse(raw_list, mode):
         the prepared and final form of the information
     """
 
-    # list which stores the "unwrapped" habit information. Takes list of habit instances and expands into list of lists,
-    # with each sublist containing certain traits about the habit
-    unwrapped_list = []
-
+    # each habit becomes one dash-separated line; the lines are fed to a single join as a
+    # generator, so no intermediate lists are built along the way
     if mode == 'Period':
-        for habit in raw_list:
-            unwrapped_list.append([habit.name, "streak:", str(habit.streak)])
+        return "\n".join(f"{habit.name} - streak: - {habit.streak}" for habit in raw_list)
+
+    # mode is loop-invariant, so the label and attribute getter are bound once up front
+    if mode == 'Best':
+        int_label, get_count = 'streak:', attrgetter('streak')
+    elif mode == 'Worst':
+        int_label, get_count = 'breaks:', attrgetter('fail_count')
     else:
-        for habit in raw_list:
-            if mode == 'Best':
-                int_label = 'streak:'
-                int_attr = habit.streak
-            elif mode == 'Worst':
-                int_label = 'breaks:'
-                int_attr = habit.fail_count
-            else:
-                raise ValueError("Incorrect mode entered for ui_parse function!")
-
-            if int_attr != 0:
-                unwrapped_list.append([habit.name, habit.period, int_label, str(int_attr)])
-
-    # Takes every line (list of attributes) of the unwrapped list, turns every sublist into a string separated by a dash
-    line_list = []
-
-    for line in unwrapped_list:
-        # convert streak back to a string with appropriate formatting
-        line_list.append(" - ".join(line))
-    # Turns list of strings into a single string in the form of a paragraph that is loaded into Tkinter text widget
-    final_string = "\n".join(line_list)
-    return final_string
+        raise ValueError("Incorrect mode entered for ui_parse function!")
+
+    return "\n".join(f"{habit.name} - {habit.period} - {int_label} - {get_count(habit)}"
+                     for habit in raw_list if get_count(habit) != 0)
@@ -1,10 +1,84 @@
 import datetime
+import itertools
+import sys
+from operator import itemgetter
 
 import sqlite3
-import dateutil.parser
 
 import utils
 
+# the three log types, interned once; every data row carries one of these exact objects, so the
+# parse loop can dispatch on pointer identity instead of character-by-character string comparison
+_SUCCESS = sys.intern('Success')
+_RESTART = sys.intern('Restart')
+_FAILURE = sys.intern('Failure')
+
+# maps a periodicity onto the function that counts the periods between a reference time and "now";
+# built once so load_state dispatches with a single dict lookup instead of a match block per call
+_DIFF_FUNCS = {
+    'Daily': lambda now, today, compare_time: int((today - compare_time.date()).days),
+    'Weekly': lambda now, today, compare_time: utils.diff_of_cw(now, compare_time),
+    'Monthly': lambda now, today, compare_time: utils.diff_of_cm(now, compare_time),
+}
+
+# singular/plural nouns per periodicity and the date format used across the UI, built once
+# instead of on every summary render (strftime re-parses its format string each call)
+_PERIOD_NOUNS = {'Daily': ('day', 'days'),
+                 'Weekly': ('week', 'weeks'),
+                 'Monthly': ('month', 'months')}
+_DATE_FMT = '%d %B, %Y'
+
+
+def _parse_log(data):
+    """
+    Scans a habit data list once and computes every attribute derived from it.
+
+    Kept as a module-level pure function (list in, plain values out) so the hot loop is
+    self-contained: it touches no instance attributes, which keeps the scan tight and means a
+    compiled/vectorized drop-in could replace it later without touching the class.
+
+    Args:
+        data (list): list of (name, time, log type) tuples, sorted by time.
+    Returns:
+        tuple of (streak, streaks, longest_streak, fail_count, last_success, last_fail, last_restart)
+    """
+
+    streak = 0
+    streaks = []
+    # the bound method avoids re-resolving streaks.append on every reset inside the loop
+    streaks_append = streaks.append
+    fail_count = 0
+
+    last_success = None
+    last_fail = None
+    last_restart = None
+
+    # loop through the data list
+    for row in data:
+        log_type = row[2]
+        if log_type is _SUCCESS:
+            # increment streak, update last_success
+            streak += 1
+
+            last_success = row[1]
+        elif log_type is _RESTART:
+            # take streak up until this point, append into list of streak values, then reset
+            streaks_append(streak)
+            streak = 0
+
+            last_restart = row[1]
+        elif log_type is _FAILURE:
+            # same as with restart, except also increment fail_count and update last_fail
+            streaks_append(streak)
+            streak = 0
+
+            fail_count += 1
+            last_fail = row[1]
+    # if done looping without any resets, load streak into list regardless
+    streaks_append(streak)
+
+    return streak, streaks, max(streaks), fail_count, last_success, last_fail, last_restart
+
 
 class Habit:
     """
@@ -77,7 +151,40 @@ class Habit:
     """
     db_name = ""
 
-    def __init__(self, name: str, period: str, start_date: str, data=None):
+    # fixed slots instead of a per-instance __dict__: smaller instances and faster attribute
+    # access, which adds up once many habits are loaded for analytics
+    __slots__ = ('name', 'period', 'start_date', 'data', 'streak', 'streaks', 'longest_streak',
+                 'fail_count', 'last_success', 'last_fail', 'last_restart', 'state', '_pending', '_summary')
+
+    # shared connection cache; opened lazily by _connection() and reused by every instance
+    _conn = None
+    _conn_db = None
+
+    @classmethod
+    def _connection(cls):
+        """
+        Returns the shared SQLite connection, opening it on first use.
+
+        Opening a connection per method call pays page-cache warmup and journal setup every time,
+        which dominates load time when many habits are constructed at once. The connection is
+        therefore opened once per database file and cached on the class; if db_name is re-pointed
+        at another file (as the tests do), a fresh connection is made for it.
+
+        The connection runs in autocommit mode with WAL journaling, so single statements commit
+        immediately and multi-statement writes can be wrapped in explicit transactions.
+        """
+
+        if cls._conn is None or cls._conn_db != cls.db_name:
+            if cls._conn is not None:
+                cls._conn.close()
+            cls._conn = sqlite3.connect(cls.db_name, check_same_thread=False, isolation_level=None)
+            cls._conn.execute("PRAGMA journal_mode=WAL")
+            cls._conn.execute("PRAGMA synchronous=NORMAL")
+            cls._conn.execute("PRAGMA temp_store=MEMORY")
+            cls._conn_db = cls.db_name
+        return cls._conn
+
+    def __init__(self, name: str, period: str, start_date: str, data=None, presorted=False):
         """
         Initializes Habit class.
 
@@ -86,6 +193,8 @@ class Habit:
         period (string): has to be 'Daily', 'Weekly' or 'Monthly', otherwise exception is raised.
         start_date (string, datetime.date or datetime.datetime): converted into datetime.date regardless of input.
         data (list): Predefined data can be passed here.
+        presorted (bool): set to True when the passed data is already ordered by time (e.g. it came
+        out of an ORDER BY query), which skips the sort on it.
         """
 
         if len(name) > 32:
@@ -93,29 +202,39 @@ class Habit:
         else:
             self.name = name
 
-        if period in ['Daily', 'Weekly', 'Monthly']:
-            self.period = period
+        if period in ('Daily', 'Weekly', 'Monthly'):
+            # interned so the dict lookups and equality tests that dispatch on the period
+            # throughout the tracker resolve by pointer identity
+            self.period = sys.intern(period)
         else:
             raise ValueError("Please make sure the periodicity is either daily, weekly or monthly!")
 
-        if type(start_date) == str:
-            self.start_date = dateutil.parser.isoparse(start_date)
-        elif type(start_date) == datetime.date:
-            self.start_date = utils.add_midnight(start_date, datetime.min.time())
-        elif type(start_date) == datetime.datetime:
+        # datetime.datetime is a subclass of datetime.date, so the datetime check has to come first
+        if isinstance(start_date, str):
+            # the stdlib parser is C-implemented and much faster than dateutil on the ISO strings we store
+            self.start_date = datetime.datetime.fromisoformat(start_date)
+        elif isinstance(start_date, datetime.datetime):
             self.start_date = start_date
+        elif isinstance(start_date, datetime.date):
+            self.start_date = utils.add_midnight(start_date)
         else:
             raise ValueError("Please make sure that the supplied start date is either an ISO-Format datetime string or a datetime datetime/date object!")
 
         if data is not None:
-            self.data = sorted(data, key=lambda x: x[1])
+            rows = data if presorted else sorted(data, key=itemgetter(1))
+            # re-intern the log types so the parse loop can rely on identity comparison even for
+            # rows that were built outside this module
+            self.data = [(x[0], x[1], sys.intern(x[2])) for x in rows]
+            # externally supplied rows may not be in the database yet, so they all count as unsaved
+            self._pending = [(x[0], x[1].isoformat(), x[2]) for x in self.data]
         elif data is None:
             self.data = []
-            with sqlite3.connect(self.db_name) as conn:
-                cur = conn.cursor()
-                # load date from SQLite database into data list
-                for row in cur.execute("SELECT * FROM Log WHERE Name=? ORDER BY Time ASC", (self.name,)).fetchall():
-                    self.data.append((row[0], dateutil.parser.isoparse(row[1]), row[2]))
+            self._pending = []
+            cur = type(self)._connection().cursor()
+            # load date from SQLite database into data list
+            for row in cur.execute("SELECT Name, Time, Log_Type FROM Log WHERE Name=? ORDER BY Time ASC",
+                                   (self.name,)).fetchall():
+                self.data.append((row[0], datetime.datetime.fromisoformat(row[1]), sys.intern(row[2])))
 
         self.parse_data()
         self.load_state()
@@ -125,50 +244,28 @@ class Habit:
         Loops through the data list and (re)loads the parameters that are derived from it.
 
         Updates streak, list of streaks, last_success, last_restart, last_fail and fail_count
+
+        This is the rebuild-from-scratch path, used when a whole data list arrives at once
+        (construction, or data passed from outside.) Single check-offs, restarts and breaks update
+        the derived attributes in place instead, so their cost stays constant no matter how long
+        the habit history grows.
         """
 
-        self.streak = 0
-        self.streaks = []
-        self.longest_streak = 0
-        self.fail_count = 0
-
-        self.last_success = None
-        self.last_fail = None
-        self.last_restart = None
-
-        # loop through the data list
-        for row in self.data:
-            match row[2]:
-                case 'Success':
-                    # increment streak, update last_success
-                    self.streak += 1
-
-                    self.last_success = row[1]
-                case 'Restart':
-                    # take streak up until this point, append into list of streak values, then reset
-                    self.streaks.append(self.streak)
-                    self.streak = 0
-
-                    self.last_restart = row[1]
-                case 'Failure':
-                    # same as with restart, except also increment fail_count and update last_fail
-                    self.streaks.append(self.streak)
-                    self.streak = 0
-
-                    self.fail_count += 1
-                    self.last_fail = row[1]
-        # if done looping without any resets, load streak into list regardless
-        self.streaks.append(self.streak)
-
-        if self.streaks:
-            self.longest_streak = max(self.streaks)
-        else:
-            self.longest_streak = 0
+        (self.streak, self.streaks, self.longest_streak, self.fail_count,
+         self.last_success, self.last_fail, self.last_restart) = _parse_log(self.data)
+
+        self._summary = None
 
-    def load_state(self):
+    def load_state(self, now=None, today=None):
         """
         Loads state.
 
+        Args:
+        now (datetime.datetime): optional; the moment to treat as "now". Callers refreshing many
+        habits in one pass can compute this once and share it, saving a clock read per habit and
+        keeping the whole pass consistent. Defaults to datetime.datetime.now().
+        today (datetime.date): optional; defaults to the date of now.
+
         First, declares a 'compare_time' with which to compare the current time.
         compare_time is either last_success or last_restart (whichever is more recent.)
         If both are missing (like with a newly-created habit), take start_date instead.
@@ -187,19 +284,18 @@ class Habit:
         record is not already a 'Failure'.
         """
 
+        if now is None:
+            now = datetime.datetime.now()
+        if today is None:
+            today = now.date()
+
         if self.last_success is None and self.last_restart is None:
             compare_time = self.start_date
         else:
             compare_time = max((self.last_success if self.last_success is not None else datetime.datetime.min),
                                (self.last_restart if self.last_restart is not None else datetime.datetime.min))
 
-        match self.period:
-            case 'Daily':
-                differential = int((datetime.date.today() - compare_time.date()).days)
-            case 'Weekly':
-                differential = utils.diff_of_cw(datetime.datetime.now(), compare_time)
-            case 'Monthly':
-                differential = utils.diff_of_cm(datetime.datetime.now(), compare_time)
+        differential = _DIFF_FUNCS[self.period](now, today, compare_time)
 
         if differential == 1:
             self.state = 'Ready'
@@ -209,18 +305,33 @@ class Habit:
             self.state = 'Broken'
 
             if self.data == [] or self.data[-1][2] != 'Failure':
-                self.data.append((self.name, datetime.datetime.now(), 'Failure'))
-
-        self.parse_data()
+                self.data.append((self.name, now, 'Failure'))
+                self._pending.append((self.name, now.isoformat(), 'Failure'))
+                # a break closes the current streak and opens an empty one; update in place
+                self.streaks.append(0)
+                self.streak = 0
+                self.fail_count += 1
+                self.last_fail = now
+                self._summary = None
 
     def check_off(self):
         """
         Inserts a "Success" record for the habit into the Log table.
         """
 
-        self.data.append((self.name, datetime.datetime.now(), 'Success'))
+        check_time = datetime.datetime.now()
+        self.data.append((self.name, check_time, 'Success'))
+        self._pending.append((self.name, check_time.isoformat(), 'Success'))
+
+        # a success only extends the current streak, so the derived attributes are updated
+        # in place rather than re-parsing the whole data list
+        self.streak += 1
+        self.streaks[-1] = self.streak
+        if self.streak > self.longest_streak:
+            self.longest_streak = self.streak
+        self.last_success = check_time
+        self._summary = None
 
-        self.parse_data()
         self.load_state()
 
     def restart(self):
@@ -228,9 +339,16 @@ class Habit:
         Inserts a "Restart" record for the habit into the log table.
         """
 
-        self.data.append((self.name, datetime.datetime.now(), 'Restart'))
+        restart_time = datetime.datetime.now()
+        self.data.append((self.name, restart_time, 'Restart'))
+        self._pending.append((self.name, restart_time.isoformat(), 'Restart'))
+
+        # close off the current streak and start an empty one; same in-place update as check_off
+        self.streaks.append(0)
+        self.streak = 0
+        self.last_restart = restart_time
+        self._summary = None
 
-        self.parse_data()
         self.load_state()
 
     @classmethod
@@ -239,47 +357,131 @@ class Habit:
         Class method to establish the necessary tables (and connection between them) inside the database file.
         """
 
-        with sqlite3.connect(cls.db_name) as conn:
-            cur = conn.cursor()
-            cur.execute("""CREATE TABLE IF NOT EXISTS Habit (
+        cur = cls._connection().cursor()
+        cur.execute("""CREATE TABLE IF NOT EXISTS Habit (
             Name VARCHAR(32) PRIMARY KEY,
             Period VARCHAR(7),
             Start_Date DATETIME
             )""")
-            cur.execute("""CREATE TABLE IF NOT EXISTS Log (
-            Name VARCHAR(32),
-            Time DATETIME,
-            Log_Type VARCHAR(7),
-            PRIMARY KEY(Name, Time, Log_Type),
-            FOREIGN KEY(Name) REFERENCES Habits(NAME)
-            )""")
+        cur.execute("""CREATE TABLE IF NOT EXISTS Log (
+        Name VARCHAR(32),
+        Time DATETIME,
+        Log_Type VARCHAR(7),
+        PRIMARY KEY(Name, Time, Log_Type),
+        FOREIGN KEY(Name) REFERENCES Habits(NAME)
+        )""")
+        # index for the single-habit load path, so per-name Log queries don't scan the whole table
+        cur.execute("CREATE INDEX IF NOT EXISTS idx_log_name ON Log(Name)")
+
+    @classmethod
+    def load_all(cls):
+        """
+        Class method that loads every habit stored in the database at once.
+
+        Constructing habits one by one issues a separate Log query per habit; this instead pulls
+        the whole Log table in a single query, groups the rows by habit name, and hands each habit
+        its data list directly (so __init__ skips its own database query.)
+
+        Returns:
+            list of Habit instances, one per row of the Habit table.
+        """
+
+        cur = cls._connection().cursor()
+
+        # bucket the log rows by habit name; the query orders by name, so groupby sees each name once
+        log_rows = cur.execute("SELECT Name, Time, Log_Type FROM Log ORDER BY Name, Time ASC").fetchall()
+        logs = {}
+        for name, rows in itertools.groupby(log_rows, key=lambda row: row[0]):
+            logs[name] = [(row[0], datetime.datetime.fromisoformat(row[1]), row[2]) for row in rows]
+
+        return [cls(name, period, start_date, data=logs.get(name, []), presorted=True)
+                for name, period, start_date in cur.execute("SELECT Name, Period, Start_Date FROM Habit").fetchall()]
 
     def delete_from_db(self):
         """
         Wipes the habit off of the database, deleting its entries from both tables.
         """
-        with sqlite3.connect(self.db_name) as conn:
-            cur = conn.cursor()
-            cur.execute("DELETE FROM Habit WHERE Name=?",
-                              (self.name,))
-            cur.execute("DELETE FROM Log WHERE Name=?",
-                              (self.name,))
+        cur = type(self)._connection().cursor()
+        cur.execute("DELETE FROM Habit WHERE Name=?",
+                    (self.name,))
+        cur.execute("DELETE FROM Log WHERE Name=?",
+                    (self.name,))
 
-    def save_to_db(self):
+    def summary(self):
         """
-        Updates database by replacing the Log entries in the DB with the contents of the Habit.data attribute.
+        Returns the habit summary text shown in the GUI's lower info box.
+
+        The string is built from the derived attributes and cached on the instance; check-offs,
+        restarts, detected breaks and full re-parses clear the cache, so browsing between habits
+        in the UI costs a single lookup instead of re-deriving and re-formatting everything.
         """
 
-        with sqlite3.connect(self.db_name) as conn:
-            cur = conn.cursor()
-            # if habit does not exist in Habit table, enter it there
-            if cur.execute("SELECT * FROM Habit WHERE Name=?", (self.name,)).fetchone() is None:
-                # as the default SQLite 3 converter is deprecated, conversions to iso format happen
-                cur.execute("INSERT INTO Habit VALUES (?, ?, ?)", (self.name, self.period, self.start_date.isoformat()))
+        if self._summary is not None:
+            return self._summary
 
-            cur.execute("DELETE FROM Log WHERE Name=?", (self.name,))
-            # list comprehension to convert self.data into iso format to write into SQL database
-            cur.executemany("INSERT INTO Log VALUES (?, ?, ?)", [(x[0], x[1].isoformat(), x[2]) for x in self.data])
+        # name and periodicity of habit to start off with
+        line_one = f"Selected habit: {self.name} {self.period.lower()}."
+
+        # length of current streak in units depending periodicity: Current streak: x day(s)/week(s)/month(s)
+        if self.streak != 0:
+            noun = _PERIOD_NOUNS[self.period][0 if self.streak == 1 else 1]
+            line_two = f"Current streak: {self.streak} {noun}"
+        else:
+            line_two = ""
+
+        # start date, formatted more elegantly
+        line_three = f"started on: {self.start_date.strftime(_DATE_FMT)}"
+
+        # if it has been checked or restarted at any point, shows the last date of the action
+        if self.last_success is not None:
+            line_four = f"last checked on: {self.last_success.strftime(_DATE_FMT)}"
+        else:
+            line_four = ""
+
+        # if it has ever been broken at any point, shows last date of that as well
+        if self.last_fail is not None:
+            line_five = f"habit was recently broken on {self.last_fail.strftime(_DATE_FMT)}"
+        else:
+            line_five = ""
+
+        self._summary = (f"{line_one}\n"
+                         f"{line_two}\n\n"
+                         f"{line_three}\n\n"
+                         f"{line_four}\n"
+                         f"{line_five}")
+        return self._summary
+
+    def save_to_db(self):
+        """
+        Updates database by writing the Log rows appended since the last save.
+
+        Rows are collected in the _pending list by check_off, restart and load_state, so a save
+        only costs the handful of new rows instead of rewriting the whole history. INSERT OR IGNORE
+        is safe here because (Name, Time, Log_Type) is the primary key of the Log table.
+        """
+
+        cur = type(self)._connection().cursor()
+        # datetimes are converted to ISO strings up front and bound as plain text, so nothing ever
+        # goes through SQLite's (deprecated) default datetime adapter
+        start_iso = self.start_date.isoformat()
+
+        # explicit transaction so the habit row and the new log rows land atomically with one commit
+        cur.execute("BEGIN IMMEDIATE")
+        try:
+            # if habit does not exist in Habit table, enter it there; Name is the primary key,
+            # so OR IGNORE does the existence check inside SQLite instead of a separate SELECT
+            cur.execute("INSERT OR IGNORE INTO Habit VALUES (?, ?, ?)", (self.name, self.period, start_iso))
+
+            cur.executemany("INSERT OR IGNORE INTO Log VALUES (?, ?, ?)", self._pending)
+            cur.execute("COMMIT")
+        except sqlite3.Error:
+            cur.execute("ROLLBACK")
+            raise
+        self._pending.clear()
 
     def __str__(self):
+        """
+        The string form of a habit is its (immutable) name — a constant-time attribute read, so
+        repeated stringification (habit_namelist, listbox rows, combobox values) needs no caching.
+        """
         return self.name
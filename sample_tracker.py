@@ -1,11 +1,8 @@
 import datetime
 
-import sqlite3
 import tkinter as tk
-from tkinter import ttk
 
 from habit import Habit
-import analytics
 import utils
 
 """
@@ -22,10 +19,20 @@ The tables here can be reloaded by running the test_db_integration.py module aga
 # declaring test database as the habit database for this module
 Habit.db_name = r"test\test_db.db"
 
+# maps a log type onto the glyph and verb shown in the analytics history view
+_ACTION_GLYPH = {'Success': "✅ Completed",
+                 'Failure': "❌ Broken",
+                 'Restart': "🔄 Restarted"}
+
 if __name__ == "__main__":
 
     Habit.initialize_db()
 
+    # single shared connection for this module's own queries; Habit._connection() is already
+    # opened in autocommit mode with the WAL/synchronous pragmas applied, so reusing it avoids
+    # paying a fresh connection open on every UI action
+    _conn = Habit._connection()
+
     # list of all habits as instances of Habit class (this is used by core functionality)
     habit_group = []
     # list of all habit names (string representations) (this is used by Tkinter)
@@ -39,23 +46,14 @@ if __name__ == "__main__":
         Operates on two lists:
         habit_group is the list of Habit objects, which is central to the application,
         and habit_namelist is the list of habit names, which is needed by some Tkinter widgets.
-        """
 
-        global habit_group
-        global habit_namelist
-
-        habit_group = []
-        habit_namelist = []
+        Habit.load_all() fetches all habits and their logs in two queries, and the slice
+        assignments refill the lists in place, so existing references stay valid and no
+        global-reassignment dance is needed.
+        """
 
-        with sqlite3.connect(Habit.db_name) as conn:
-            cur = conn.cursor()
-            query_result = cur.execute("SELECT * FROM Habit").fetchall()
-        for row in query_result:
-            habit_group.append(
-                Habit(name=row[0], period=row[1], start_date=row[2])
-            )
-        for x in habit_group:
-            habit_namelist.append(str(x))
+        habit_group[:] = Habit.load_all()
+        habit_namelist[:] = [str(habit) for habit in habit_group]
 
 
     load_habits_from_db()
@@ -68,9 +66,12 @@ if __name__ == "__main__":
     upper_frame.pack()
 
     # the listbox is essentially the central widget here; this is where the user accesses the habits to manipulate them
-    habit_listbox_stringvar = tk.StringVar(value=habit_namelist)
-    habit_listbox = tk.Listbox(upper_frame, listvariable=habit_listbox_stringvar, exportselection=False)
+    habit_listbox = tk.Listbox(upper_frame, exportselection=False)
     habit_listbox.grid(column=1, row=1)
+    # initial fill; afterwards single items are inserted/deleted in place, which keeps selection
+    # and scroll position intact instead of re-rendering the whole list through a listvariable
+    for habit_name in habit_namelist:
+        habit_listbox.insert(tk.END, habit_name)
 
     # lower frame contains brief summary of habit that is loaded upon selection, and clock
     lower_frame = tk.Frame(root, padx=8, pady=8)
@@ -84,24 +85,51 @@ if __name__ == "__main__":
     current_habit = None
 
 
+    # id of the currently scheduled (not yet executed) selection callback, if any
+    _pending_select = None
+
+
     def on_habit_select(evt):
         """
-        Fetches current habit instance every time user selects something on the listbox, updating the current_habit variable.
+        Schedules the selection work every time the user selects something on the listbox.
+
+        Holding an arrow key fires <<ListboxSelect>> for every intermediate row, so instead of
+        re-rendering immediately the handler waits 60 ms (below the perception threshold) and
+        cancels any still-pending run — a burst of selections collapses into one render of the
+        final row.
 
         Args:
             evt (event object): passed to the function by the listbox bind method.
         """
 
+        global _pending_select
+
+        if _pending_select is not None:
+            root.after_cancel(_pending_select)
+        _pending_select = root.after(60, _do_select, evt)
+
+
+    def _do_select(evt):
+        """
+        Performs the actual selection work (updating current_habit and re-rendering) once the
+        debounce delay has passed.
+
+        Args:
+            evt (event object): forwarded by on_habit_select.
+        """
+
         global current_habit
+        global _pending_select
 
-        w = evt.widget
-        try:
-            index = int(w.curselection()[0])
-            current_habit = habit_group[habit_listbox.curselection()[0]]
-            value = w.get(index)
-            reload_info(current_habit)
-        except IndexError:
-            pass
+        _pending_select = None
+
+        # a single curselection() round-trip; the event widget is the habit listbox itself
+        sel = evt.widget.curselection()
+        if not sel:
+            return
+
+        current_habit = habit_group[sel[0]]
+        reload_info(current_habit)
 
 
     # bind method calls on_habit_select function whenever something is selected
@@ -111,7 +139,7 @@ if __name__ == "__main__":
 
 
     # called on every habit select, as well as after other actions, in order to reload all the information
-    def reload_info(current_habit):
+    def reload_info(current_habit, force=False):
         """
         Reloads the information displayed on the graphical user interface.
         This includes putting together a summary of the selected habit for the lower text box,
@@ -119,83 +147,49 @@ if __name__ == "__main__":
 
         Args:
             current_habit(Habit): the current habit provided and updated by the listbox.
+            force (bool): pass True after a mutation, so the re-render is not skipped by the
+            same-habit memoization below.
         """
 
+        # re-selecting the same habit changes nothing on screen, so skip the rebuild entirely
+        if current_habit is reload_info._last and not force:
+            return
+        reload_info._last = current_habit
+
         # checks whether or not a habit is selected by listbox (curselection() returns a tuple; if empty, clears text.)
         if not habit_listbox.curselection():
             habit_info.delete('1.0', tk.END)
-        # if there is a selected habit, prepares to render summary text depending on attributes:
+        # if there is a selected habit, renders its summary text:
         else:
-            # make sure the habit instance is up to date
-            current_habit.parse_data()
-            current_habit.load_state()
-
-            # the following section deifnes each line of text in the summary text box
-            # name and periodicity of habit to start off with
-            line_one = f"Selected habit: {str(current_habit)} {str(current_habit.period).lower()}."
-
-            # dict to hold all the different words depending on streak length (plurality)
-            period_nouns = {'Daily': ('day', 'days'),
-                            'Weekly': ('week', 'weeks'),
-                            'Monthly': ('month', 'months')}
-            # singular
-            if current_habit.streak == 1:
-                i = 0
-            # plural
-            elif current_habit.streak > 1:
-                i = 1
-
-            # length of current streak in units depending periodicity: Current streak: x day(s)/week(s)/month(s)
-            if current_habit.streak != 0:
-                line_two = f"Current streak: {current_habit.streak} {period_nouns[current_habit.period][i]}"
-            else:
-                line_two = ""
-
-            # start date, formatted more elegantly
-            line_three = f"started on: {current_habit.start_date.strftime("%d %B, %Y")}"
-
-            # if it has been checked or restarted at any point, shows the last date of the action
-            if current_habit.last_success is not None:
-                line_four = f"last checked on: {current_habit.last_success.strftime("%d %B, %Y")}"
-            else:
-                line_four = ""
+            # the summary string is cached on the habit and only rebuilt after a mutation,
+            # so browsing the list is a plain text paste
+            habit_info.delete("1.0", tk.END)
+            habit_info.insert(index="1.0", chars=current_habit.summary())
 
-            # if it has ever been broken at any point, shows last date of that as well
-            if current_habit.last_fail is not None:
-                line_five = f"habit was recently broken on {current_habit.last_fail.strftime("%d %B, %Y")}"
-            else:
-                line_five = ""
+        # the buttons themselves are created once at startup; from here only their state is toggled
 
-            # renders habit summary into text widget
-            habit_info.delete("1.0", tk.END)
-            habit_info.insert(index="1.0",
-                              chars=f"{line_one}\n"
-                                    f"{line_two}\n\n"
-                                    f"{line_three}\n\n"
-                                    f"{line_four}\n"
-                                    f"{line_five}")
-
-        # renders check-off button only if the selected habit is ready
-        check_off_habit_button = tk.Button(upper_frame, text="Check off Habit", command=button_check_off)
-        check_off_habit_button.grid(column=0, row=0)
-        if current_habit.state == 'Ready':
+        # check-off button is enabled only if the selected habit is ready
+        if current_habit is not None and current_habit.state == 'Ready':
             check_off_habit_button['state'] = 'normal'
         else:
             check_off_habit_button['state'] = 'disabled'
 
         # restart button, available if the selected habit's last record is not also a restart
-        restart_habit_button = tk.Button(upper_frame, text="Restart Habit", command=button_restart_habit)
-        restart_habit_button.grid(column=0, row=1)
         if (current_habit is None or
                 not current_habit.data or
                 current_habit.data[-1][2] == 'Restart'):
             restart_habit_button['state'] = 'disabled'
+        else:
+            restart_habit_button['state'] = 'normal'
 
         # delete button, available at any time so long as a habit is selected
-        delete_habit_button = tk.Button(upper_frame, text="Delete Habit", command=button_delete_habit)
-        delete_habit_button.grid(column=2, row=1)
         if current_habit is None:
             delete_habit_button['state'] = 'disabled'
+        else:
+            delete_habit_button['state'] = 'normal'
+
+    # memoizes the last habit rendered by reload_info
+    reload_info._last = None
 
 
     # defining the functions that the buttons will execute:
@@ -207,8 +201,9 @@ if __name__ == "__main__":
         current_habit.check_off()
         current_habit.save_to_db()
 
-        load_habits_from_db()
-        reload_info(current_habit)
+        # the habit object in habit_group was mutated in place and its name is unchanged,
+        # so there is nothing to reload
+        reload_info(current_habit, force=True)
 
 
     def button_restart_habit():
@@ -219,8 +214,8 @@ if __name__ == "__main__":
         current_habit.restart()
         current_habit.save_to_db()
 
-        load_habits_from_db()
-        reload_info(current_habit)
+        # same as check-off: the in-memory habit is already up to date
+        reload_info(current_habit, force=True)
 
 
     def button_delete_habit():
@@ -229,11 +224,30 @@ if __name__ == "__main__":
         """
 
         current_habit.delete_from_db()
-        habit_listbox.delete(habit_listbox.curselection()[0])
+
+        # drop the habit from the in-memory lists directly instead of reloading everything
+        idx = habit_listbox.curselection()[0]
+        del habit_group[idx]
+        del habit_namelist[idx]
+
+        habit_listbox.delete(idx)
         habit_listbox.selection_clear(0, 'end')
 
-        load_habits_from_db()
-        reload_info(current_habit)
+        reload_info(current_habit, force=True)
+
+
+    # the three habit-dependent buttons, created exactly once; reload_info only toggles their state
+    check_off_habit_button = tk.Button(upper_frame, text="Check off Habit", command=button_check_off)
+    check_off_habit_button.grid(column=0, row=0)
+    check_off_habit_button['state'] = 'disabled'
+
+    restart_habit_button = tk.Button(upper_frame, text="Restart Habit", command=button_restart_habit)
+    restart_habit_button.grid(column=0, row=1)
+    restart_habit_button['state'] = 'disabled'
+
+    delete_habit_button = tk.Button(upper_frame, text="Delete Habit", command=button_delete_habit)
+    delete_habit_button.grid(column=2, row=1)
+    delete_habit_button['state'] = 'disabled'
 
 
     # makes a new toplevel window whenever the user wants to add a new habit: name and periodicity are collected there
@@ -277,26 +291,38 @@ if __name__ == "__main__":
             before inserting the new habit into the Habit table of the database.
             """
 
-            if not period_var.get() or not new_habit_name.get() or period_var.get().isspace() or new_habit_name.get().isspace():
+            # each .get() is a Tcl round-trip, so both values are read exactly once up front
+            name = new_habit_name.get()
+            period = period_var.get()
+
+            if not period or not name or period.isspace() or name.isspace():
                 utils.error_popup("Needs name and periodicity!")
-            elif new_habit_name.get() in habit_namelist:
+            elif name in habit_namelist:
                 utils.error_popup(
-                    f"There already exists a habit named {new_habit_name.get()}!\nPlease choose another name.")
-            elif len(new_habit_name.get()) > 32:
+                    f"There already exists a habit named {name}!\nPlease choose another name.")
+            elif len(name) > 32:
                 utils.error_popup("Name is too long! Name can be up to 32 characters.")
             else:
-                with sqlite3.connect(Habit.db_name) as conn:
-                    cur = conn.cursor()
-                    cur.execute("INSERT INTO Habit VALUES(?, ?, ?)",
-                                (new_habit_name.get(), period_var.get(), datetime.date.today().isoformat()))
-                load_habits_from_db()
-                habit_listbox_stringvar.set(value=habit_namelist)
+                # RETURNING hands the inserted row back on the same round-trip, so the habit is
+                # built from exactly what the database stored, with no follow-up SELECT
+                row = _conn.execute("INSERT INTO Habit VALUES(?, ?, ?) RETURNING Name, Period, Start_Date",
+                                    (name, period, datetime.date.today().isoformat())).fetchone()
+
+                # append the new habit in place rather than reloading every habit from the database;
+                # a just-created habit has no log rows, so data=[] skips the Log query entirely
+                new_habit = Habit(name=row[0], period=row[1], start_date=row[2], data=[])
+                habit_group.append(new_habit)
+                habit_namelist.append(str(new_habit))
+                habit_listbox.insert(tk.END, habit_namelist[-1])
 
         # button to confirm creation of new habit
         create_button = tk.Button(add_interface, command=create_new_habit, text="Create New Habit")
         create_button.grid(column=1, row=1)
 
-        add_interface.mainloop()
+        # the Toplevel is serviced by the root mainloop; running a second, nested mainloop here
+        # would stack event loops and add dispatch latency. Keep the popup modal instead.
+        add_interface.transient(root)
+        add_interface.grab_set()
 
 
     # button in main window that triggers pop-up of "add habit" interface
@@ -312,12 +338,22 @@ if __name__ == "__main__":
     def run_clock():
         """
         Updates clock widget (Tkinter text) every second.
+
+        The widget is rewritten only when the displayed second actually changes, and the next tick
+        is scheduled just past the upcoming second boundary so the display never drifts or
+        double-updates within one second.
         """
 
         current_time = datetime.datetime.now()
-        clock.delete('1.0', tk.END)
-        clock.insert('1.0', str(current_time)[0:19])
-        root.after(1000, run_clock)
+        clock_text = str(current_time)[0:19]
+        if clock_text != run_clock._last_text:
+            clock.delete('1.0', tk.END)
+            clock.insert('1.0', clock_text)
+            run_clock._last_text = clock_text
+        root.after(1000 - current_time.microsecond // 1000, run_clock)
+
+    # last string rendered into the clock widget
+    run_clock._last_text = None
 
 
     run_clock()
@@ -327,8 +363,15 @@ if __name__ == "__main__":
         """
         Renders analytics module window and all of its parts.
         Function is called by the button of the same name.
+
+        ttk and the analytics module are imported here rather than at module top: they are only
+        needed once this window opens, deferring them shortens app startup, and sys.modules
+        caching makes every open after the first free.
         """
 
+        from tkinter import ttk
+        import analytics
+
         if not habit_group:
             utils.error_popup("There are no habits for you to analyze!")
         else:
@@ -376,7 +419,9 @@ if __name__ == "__main__":
             habits_stringvar_combobox = tk.StringVar(value=habit_namelist)
             detail_select = ttk.Combobox(analytics_upper_frame, textvariable=habits_stringvar_combobox)
             detail_select.grid(column=1, row=0)
-            detail_select['values'] = habit_group
+            # pre-built name strings; handing over Habit objects would make Tk re-run str() on
+            # every habit each time the dropdown renders
+            detail_select['values'] = tuple(habit_namelist)
             detail_select.current(0)
 
             # renders history text box
@@ -398,19 +443,12 @@ if __name__ == "__main__":
                 # loads habit start date; date here is formatted more elegantly again as with the rest of the UI
                                           f"🚀 Started on {selected_habit.start_date.strftime("%d %B, %Y")}\n")
 
-                # loops through data list of the selected habit and generates lines of text
+                # builds one line per Log entry and pastes the whole history in a single
+                # insert — every separate Text.insert would be its own Tcl round-trip
                 # row[0] is habit name, row[1] is date, and row[2] is action
-                for row in selected_habit.data:
-                    match row[2]:
-                        case 'Success':
-                            action_for_string = "✅ Completed"
-                        case 'Failure':
-                            action_for_string = "❌ Broken"
-                        case 'Restart':
-                            action_for_string = "🔄 Restarted"
-
-                    # loads all the Log entries for the user, in order:
-                    detail_text.insert(tk.END, chars=f"{action_for_string} on {row[1].strftime("%d %B, %Y")}\n")
+                detail_text.insert(tk.END, chars="".join(
+                    f"{_ACTION_GLYPH[row[2]]} on {row[1].strftime("%d %B, %Y")}\n"
+                    for row in selected_habit.data))
 
             # finally, binds function to combobox selection
             detail_select.bind('<<ComboboxSelected>>', on_combobox_select)
@@ -14,26 +14,31 @@ from .test_habit import testing_data, testing_habits
 import analytics
 
 
-# taking the regular testing_habits fixture and drawing from it only the values, as we will only need them for this test
+# taking the regular testing_habits fixture and drawing from it only the values, as we will only need them for this test.
+# materialized into a tuple so each test iterates a flat sequence instead of re-walking the dict's hash table
 @pytest.fixture
 def habits(testing_habits):
-    yield testing_habits.values()
+    yield tuple(testing_habits.values())
 
 
 def test_best(habits):
+    best = analytics.best(habits)[0]
+
     # verifying which habit is the best
-    assert analytics.best(habits)[0].name == 'Take a walk'
+    assert best.name == 'Take a walk'
 
-    # comparing best function with calculating highest streak of habit group through lambda
-    assert analytics.best(habits)[0].streak == max([x.streak for x in habits])
+    # comparing best function with calculating highest streak of habit group through a generator
+    assert best.streak == max(x.streak for x in habits)
 
 
 def test_worst(habits):
+    worst = analytics.worst(habits)[0]
+
     # verifying which habit is the worst
-    assert analytics.worst(habits)[0].name == 'Read for 15 minutes'
+    assert worst.name == 'Read for 15 minutes'
 
-    # comparing worst function with calculating highest frequency of breakages through lambda
-    assert analytics.worst(habits)[0].fail_count == max([x.fail_count for x in habits])
+    # comparing worst function with calculating highest frequency of breakages through a generator
+    assert worst.fail_count == max(x.fail_count for x in habits)
 
 
 def test_group_by_periodicity(habits):
@@ -50,4 +55,18 @@ def test_group_by_periodicity(habits):
 
     # seeing if the groups are sorted properly
     assert grouped_habits['Daily'][0].name == 'Take a walk'
-    assert grouped_habits['Daily'][0].streak == max([x.streak for x in habits if x.period == 'Daily'])
\ No newline at end of file
+    assert grouped_habits['Daily'][0].streak == max(x.streak for x in habits if x.period == 'Daily')
+
+
+def test_habit_collection_caching(habits):
+    collection = analytics.HabitCollection(habits)
+
+    # results match the plain functions, and repeated calls return the cached object
+    assert collection.best() == analytics.best(habits)
+    assert collection.best() is collection.best()
+
+    # invalidation forces a fresh computation
+    cached = collection.best()
+    collection.invalidate()
+    assert collection.best() is not cached
+    assert collection.best() == cached
\ No newline at end of file
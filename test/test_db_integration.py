@@ -5,6 +5,7 @@ fixture.
 """
 
 import datetime
+import itertools
 
 import pytest
 import sqlite3
@@ -38,15 +39,14 @@ def test_db_init(testing_data, db_habit_metadata):
     for dataset in testing_data.values():
         converted_testing_data.append([(x[0], utils.add_midnight(x[1]).isoformat(), x[2]) for x in dataset])
 
+    # recreate the tables from scratch in one script; fresh tables need no DELETE pass
+    cur.executescript("DROP TABLE IF EXISTS Log; DROP TABLE IF EXISTS Habit;")
     Habit.initialize_db()
 
     with conn:
-        cur.execute("DELETE FROM Habit")
-        cur.execute("DELETE FROM Log")
-
         cur.executemany("INSERT INTO Habit Values (?, ?, ?)", db_habit_metadata)
-        for dataset in converted_testing_data:
-            cur.executemany("INSERT INTO Log VALUES (?, ?, ?)", dataset)
+        # one prepared statement and bind sequence for all habits' rows, instead of one per habit
+        cur.executemany("INSERT INTO Log VALUES (?, ?, ?)", itertools.chain.from_iterable(converted_testing_data))
 
     assert cur.execute("SELECT * FROM Habit").fetchall() != []
     assert cur.execute("SELECT * FROM Log").fetchall() != []
@@ -0,0 +1,55 @@
+"""This module tests the calendar arithmetic helpers in the utils module.
+
+The calendar-week and calendar-month differences drive all of the habit state calculations, so
+their behavior is pinned down here for positive deltas, negative deltas and year boundaries.
+"""
+
+import datetime
+
+import utils
+
+
+def test_diff_of_cw():
+    monday = datetime.datetime(2024, 7, 1)
+
+    # same calendar week, regardless of weekday
+    assert utils.diff_of_cw(monday, monday) == 0
+    assert utils.diff_of_cw(monday + datetime.timedelta(days=6), monday) == 0
+
+    # positive and negative week deltas are symmetric
+    assert utils.diff_of_cw(monday + datetime.timedelta(days=7), monday) == 1
+    assert utils.diff_of_cw(monday, monday + datetime.timedelta(days=7)) == -1
+    assert utils.diff_of_cw(monday + datetime.timedelta(days=28), monday) == 4
+
+    # year boundary: CW resets but the difference keeps counting
+    assert utils.diff_of_cw(datetime.datetime(2024, 1, 3), datetime.datetime(2023, 12, 27)) == 1
+    # a year apart is 52 weeks, not 0, even though the flat CW number matches
+    assert utils.diff_of_cw(datetime.datetime(2024, 8, 14), datetime.datetime(2023, 8, 16)) == 52
+
+
+def test_diff_of_cw_matches_monday_shift_definition():
+    # sweep ten years of dates against a fixed reference, in both directions, and compare against
+    # a straightforward shift-to-Monday implementation of the calendar-week difference
+    reference = datetime.datetime(2024, 7, 1)
+    reference_monday = reference - datetime.timedelta(days=reference.weekday())
+
+    for offset in range(-1825, 1826):
+        day = reference + datetime.timedelta(days=offset)
+        monday = day - datetime.timedelta(days=day.weekday())
+        expected = (monday - reference_monday).days // 7
+
+        assert utils.diff_of_cw(day, reference) == expected
+        assert utils.diff_of_cw(reference, day) == -expected
+
+
+def test_diff_of_cm():
+    # same calendar month, regardless of day
+    assert utils.diff_of_cm(datetime.datetime(2024, 7, 1), datetime.datetime(2024, 7, 31)) == 0
+
+    # positive and negative month deltas are symmetric
+    assert utils.diff_of_cm(datetime.datetime(2024, 8, 1), datetime.datetime(2024, 7, 31)) == 1
+    assert utils.diff_of_cm(datetime.datetime(2024, 7, 31), datetime.datetime(2024, 8, 1)) == -1
+
+    # year boundary: a year apart is 12 months, not 0
+    assert utils.diff_of_cm(datetime.datetime(2024, 7, 9), datetime.datetime(2023, 7, 9)) == 12
+    assert utils.diff_of_cm(datetime.datetime(2024, 1, 15), datetime.datetime(2023, 12, 15)) == 1
@@ -3,10 +3,15 @@ This module holds several miscellaneous functions I've had to rely on for this p
 """
 
 import datetime
+import functools
 import tkinter as tk
 
-import dateutil.relativedelta
-import dateutil.parser
+# midnight never changes, so build the time object once instead of on every call
+_MIDNIGHT = datetime.time()
+
+# bound once here so the hot callers skip the module -> class -> method attribute chain
+_now = datetime.datetime.now
+_combine = datetime.datetime.combine
 
 
 def add_midnight(date):
@@ -20,24 +25,44 @@ def add_midnight(date):
         datetime.datetime
     """
 
-    return datetime.datetime.combine(date, datetime.datetime.min.time())
+    return _combine(date, _MIDNIGHT)
+
+
+# the error pop-up window and its label, built once on first use and then reused
+_error_window = None
+_error_label = None
 
 
 def error_popup(text: str):
     """
     Makes an error pop-up window appear on screen.
 
+    The window is built once on the first call and hidden instead of destroyed when dismissed;
+    later calls just swap the label text and show it again, skipping the Toplevel/Label/Button
+    construction (each of which is a round-trip into the Tcl interpreter).
+
     Args:
         text (string): the text displayed on the inside of the window (telling the user what kind of error it was.)
     """
-    error = tk.Toplevel()
-    error.geometry("300x100")
+    global _error_window, _error_label
+
+    if _error_window is None:
+        _error_window = tk.Toplevel()
+        _error_window.geometry("300x100")
+
+        _error_label = tk.Label(_error_window)
+        _error_label.grid(column=1, row=0)
 
-    error_text = tk.Label(error, text=text)
-    error_text.grid(column=1, row=0)
+        # the bound method is already a zero-argument callable, no lambda wrapper needed
+        ok_button = tk.Button(_error_window, text="Ok", command=_error_window.withdraw)
+        ok_button.grid(column=1, row=1)
 
-    ok_button = tk.Button(error, text="Ok", command=lambda: error.destroy())
-    ok_button.grid(column=1, row=1)
+        # closing the window just hides it, keeping the widgets alive for the next error
+        _error_window.protocol("WM_DELETE_WINDOW", _error_window.withdraw)
+
+    _error_label.config(text=text)
+    _error_window.deiconify()
+    _error_window.lift()
 
 
 def run_clock(root, clock):
@@ -48,17 +73,26 @@ def run_clock(root, clock):
         root (Tkinter root object): the root window of the GUI.
         clock (Tkinter text widget object): the text widget inside of which the clock is contained.
     """
-    clock.delete("1.0", tk.END)
-    clock.insert("1.0", str(datetime.datetime.now())[0:19])
-    root.after(1000, run_clock(root, clock))
+    # the format spec dispatches to datetime's C-level strftime, writing only the nineteen
+    # characters we show instead of building the full ISO string and slicing the microseconds off.
+    # replace() swaps the text in one Tcl call where delete+insert took two.
+    clock.replace("1.0", tk.END, f"{_now():%Y-%m-%d %H:%M:%S}")
+    # after() must receive the callable and its arguments separately; calling run_clock(root, clock)
+    # here would recurse immediately instead of scheduling the next tick
+    root.after(1000, run_clock, root, clock)
 
 
+@functools.lru_cache(maxsize=4096)
 def diff_of_cm(day_a: datetime.datetime, day_b: datetime.datetime) -> int:
     """
             Returns integer difference in calendar months between two dates.
             Takes into account year difference, so that for example 09.07.2023 is not considered to be 1 month
             away from the 09.07.2024, which would happen if we were just calculating the flat calendar month.
 
+            Calendar-month difference is by definition the year delta times twelve plus the month
+            delta, so plain integer arithmetic replaces the relativedelta object the old
+            implementation built on every call.
+
             Args:
                 day_a (datetime.datetime)
                 day_b (datetime.datetime)
@@ -66,17 +100,22 @@ def diff_of_cm(day_a: datetime.datetime, day_b: datetime.datetime) -> int:
                 difference (int)
             """
 
-    diff = dateutil.relativedelta.relativedelta(day_a.replace(day=1), day_b.replace(day=1))
-
-    return int((diff.years * 12) + diff.months)
+    return (day_a.year - day_b.year) * 12 + (day_a.month - day_b.month)
 
 
+@functools.lru_cache(maxsize=4096)
 def diff_of_cw(day_a: datetime.datetime, day_b: datetime.datetime) -> int:
     """
         Returns integer difference in calendar weeks between two dates.
         Takes into account year difference, so that for example 09.08.2023 is not considered to be 1 calendar week
         away from the 16.08.2024, which would happen if we were just calculating the flat CW.
 
+        Each date is shifted back onto its week's Monday and the two are differenced; working on
+        toordinal() values keeps everything in plain integers instead of allocating two timedelta
+        objects per call. weekday() is just (ordinal + 6) % 7, so inlining it leaves one C-level
+        toordinal() call per operand and pure int math. The Monday difference is always an exact
+        multiple of seven, so the floor division is exact for negative deltas too.
+
         Args:
             day_a (datetime.datetime)
             day_b (datetime.datetime)
@@ -84,7 +123,6 @@ def diff_of_cw(day_a: datetime.datetime, day_b: datetime.datetime) -> int:
             difference (int)
         """
 
-    monday_a = (day_a - datetime.timedelta(days=day_a.weekday()))
-    monday_b = (day_b - datetime.timedelta(days=day_b.weekday()))
-
-    return int((monday_a - monday_b).days / 7)
+    ord_a = day_a.toordinal()
+    ord_b = day_b.toordinal()
+    return (ord_a - (ord_a + 6) % 7 - ord_b + (ord_b + 6) % 7) // 7